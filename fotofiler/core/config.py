@@ -3,9 +3,9 @@ Configuration module for FotoFiler.
 Handles loading and validating user configuration from files or command-line arguments.
 """
 import os
-import yaml
+import sys
 import logging
-import argparse
+import functools
 from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
@@ -23,9 +23,17 @@ class Config:
         "move": True,
         "backup": False,
         "recursive": True,
-        "dry_run": False
+        "dry_run": False,
+        "assume_yes": False,
+        "quiet": False
     }
     
+    # Directory for cached parsed configuration files
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".fotofiler", "cache")
+    
+    # Maximum number of cached configuration files to keep
+    CACHE_SIZE = 16
+    
     def __init__(self, config_path: Optional[str] = None, cli_args: Optional[Dict[str, Any]] = None):
         """
         Initialize the configuration.
@@ -55,6 +63,9 @@ class Config:
         """
         Load configuration from a YAML file.
         
+        The parsed file is cached on disk, keyed by its path, modification time
+        and size, so unchanged files aren't re-parsed on every run.
+        
         Args:
             config_path: Path to the configuration file.
             
@@ -66,20 +77,123 @@ class Config:
             logger.error("Configuration file not found: %s", config_path)
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        try:
-            with open(config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
-            
-            if not isinstance(file_config, dict):
-                raise ValueError("Configuration file must contain a YAML dictionary")
+        cache_path = self._get_cache_path(config_path)
+        file_config = self._read_cache(cache_path)
+        
+        if file_config is None:
+            file_config = self._parse_config_file(config_path)
+            self._write_cache(cache_path, file_config)
+        
+        # Update configuration with file values
+        self.config.update(file_config)
+        logger.debug("Loaded configuration from file: %s", config_path)
+    
+    def _parse_config_file(self, config_path: str) -> Dict[str, Any]:
+        """
+        Parse a YAML configuration file.
+        
+        Args:
+            config_path: Path to the configuration file.
             
-            # Update configuration with file values
-            self.config.update(file_config)
-            logger.debug("Loaded configuration from file: %s", config_path)
+        Returns:
+            Dictionary of configuration values from the file.
             
+        Raises:
+            ValueError: If the configuration file has invalid format.
+        """
+        # Imported lazily to keep CLI startup fast
+        import yaml
+        
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        
+        try:
+            with open(config_path, 'rb') as f:
+                file_config = yaml.load(f, Loader=loader)
         except yaml.YAMLError as e:
             logger.error("Error parsing configuration file: %s", e)
             raise ValueError(f"Error parsing configuration file: {e}")
+        
+        if not isinstance(file_config, dict):
+            raise ValueError("Configuration file must contain a YAML dictionary")
+        
+        return file_config
+    
+    def _get_cache_path(self, config_path: str) -> str:
+        """
+        Get the cache file path for a configuration file in its current state.
+        
+        Args:
+            config_path: Path to the configuration file.
+            
+        Returns:
+            Path of the corresponding cache file.
+        """
+        import hashlib
+        
+        stat = os.stat(config_path)
+        key = f"{os.path.abspath(config_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"config-{digest}.pkl")
+    
+    def _read_cache(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached configuration file.
+        
+        Args:
+            cache_path: Path of the cache file.
+            
+        Returns:
+            The cached configuration values, or None if there is no usable cache entry.
+        """
+        import pickle
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                file_config = pickle.load(f)
+            
+            # Mark the entry as recently used
+            os.utime(cache_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable configuration cache %s: %s", cache_path, e)
+            return None
+        
+        if not isinstance(file_config, dict):
+            return None
+        
+        logger.debug("Using cached configuration: %s", cache_path)
+        return file_config
+    
+    def _write_cache(self, cache_path: str, file_config: Dict[str, Any]) -> None:
+        """
+        Cache parsed configuration values, evicting the least recently used entries.
+        
+        Failures are logged and otherwise ignored, since the cache is only an optimization.
+        
+        Args:
+            cache_path: Path of the cache file.
+            file_config: The parsed configuration values.
+        """
+        import pickle
+        
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(file_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            
+            entries = [entry for entry in os.scandir(self.CACHE_DIR)
+                       if entry.name.startswith("config-") and entry.name.endswith(".pkl")]
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            for entry in entries[self.CACHE_SIZE:]:
+                os.remove(entry.path)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug("Could not write configuration cache %s: %s", cache_path, e)
     
     def _apply_cli_args(self, cli_args: Dict[str, Any]) -> None:
         """
@@ -159,32 +273,21 @@ class Config:
         return self.config.copy()
     
     @staticmethod
-    def parse_command_line() -> Dict[str, Any]:
+    def parse_command_line(argv: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Parse command-line arguments.
         
+        Args:
+            argv: Arguments to parse. If None, sys.argv[1:] is used.
+        
         Returns:
             Dictionary of command-line arguments.
         """
-        parser = argparse.ArgumentParser(description="FotoFiler - Photo organization tool")
-        
-        parser.add_argument("--config", help="Path to configuration file")
-        parser.add_argument("--source", help="Source directory containing photos")
-        parser.add_argument("--dest", "--destination", dest="destination", 
-                         help="Destination directory for organized photos")
-        parser.add_argument("--pattern", "--naming-pattern", dest="naming_pattern", 
-                         help="Naming pattern for files, e.g. '{date}_{camera}_{original_filename}'")
-        parser.add_argument("--hierarchy", "--folder-hierarchy", dest="folder_hierarchy", 
-                         help="Folder hierarchy pattern, e.g. 'year/month/day' or custom pattern")
-        parser.add_argument("--move", action="store_true", help="Move files instead of copying")
-        parser.add_argument("--copy", action="store_true", help="Copy files instead of moving")
-        parser.add_argument("--backup", action="store_true", help="Create backups of files")
-        parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
-        parser.add_argument("--recursive", action="store_true", help="Scan directories recursively")
-        parser.add_argument("--no-recursive", action="store_false", dest="recursive", 
-                         help="Don't scan directories recursively")
-        
-        args = parser.parse_args()
+        if argv is None:
+            argv = sys.argv[1:]
+        
+        parser = _build_parser(_needs_advanced_args(argv))
+        args = parser.parse_args(argv)
         
         # Convert args to dictionary
         cli_args = vars(args)
@@ -195,3 +298,100 @@ class Config:
             del cli_args["copy"]
         
         return cli_args
+
+# Options registered on every parser; anything else on the command line
+# (including -h/--help) triggers registration of the advanced options
+_BASE_OPTIONS = frozenset([
+    "--config", "--source", "--dest", "--destination", "--pattern", "--naming-pattern"
+])
+
+# Values the advanced options resolve to when they are not registered,
+# matching what argparse would produce if they were
+_ADVANCED_DEFAULTS = {
+    "folder_hierarchy": None,
+    "move": False,
+    "copy": False,
+    "backup": False,
+    "dry_run": False,
+    "recursive": False,
+    "assume_yes": None,
+    "quiet": None,
+}
+
+def _needs_advanced_args(argv: List[str]) -> bool:
+    """
+    Check whether the command line uses any option outside the base set.
+    
+    Args:
+        argv: The command-line arguments.
+        
+    Returns:
+        True if the advanced options must be registered, False otherwise.
+    """
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg.startswith("-") and arg.split("=", 1)[0] not in _BASE_OPTIONS:
+            return True
+    return False
+
+def _build_base_parser():
+    """
+    Build the argument parser with the options every invocation needs.
+    
+    Returns:
+        The argument parser.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="FotoFiler - Photo organization tool")
+    
+    parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--source", help="Source directory containing photos")
+    parser.add_argument("--dest", "--destination", dest="destination", 
+                     help="Destination directory for organized photos")
+    parser.add_argument("--pattern", "--naming-pattern", dest="naming_pattern", 
+                     help="Naming pattern for files, e.g. '{date}_{camera}_{original_filename}'")
+    
+    return parser
+
+def _add_advanced_args(parser) -> None:
+    """
+    Register the less frequently used options on a parser.
+    
+    Args:
+        parser: The argument parser to extend.
+    """
+    parser.add_argument("--hierarchy", "--folder-hierarchy", dest="folder_hierarchy", 
+                     help="Folder hierarchy pattern, e.g. 'year/month/day' or custom pattern")
+    parser.add_argument("--move", action="store_true", help="Move files instead of copying")
+    parser.add_argument("--copy", action="store_true", help="Copy files instead of moving")
+    parser.add_argument("--backup", action="store_true", help="Create backups of files")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    parser.add_argument("--recursive", action="store_true", help="Scan directories recursively")
+    parser.add_argument("--no-recursive", action="store_false", dest="recursive", 
+                     help="Don't scan directories recursively")
+    parser.add_argument("-y", "--yes", action="store_true", dest="assume_yes", default=None,
+                     help="Proceed without asking for confirmation")
+    parser.add_argument("--quiet", action="store_true", default=None,
+                     help="Don't print the header, configuration summary or progress bars")
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(advanced: bool):
+    """
+    Build (once) the argument parser for the given option set.
+    
+    Args:
+        advanced: If True, register the advanced options as well.
+        
+    Returns:
+        The argument parser.
+    """
+    parser = _build_base_parser()
+    
+    if advanced:
+        _add_advanced_args(parser)
+    else:
+        parser.set_defaults(**_ADVANCED_DEFAULTS)
+    
+    return parser
@@ -4,9 +4,10 @@ Configures logging functionality for the application.
 """
 import os
 import logging
-import logging.handlers
 from typing import Optional, Union
-import datetime
+
+# Background listener that writes queued records to the log file
+_queue_listener = None
 
 def setup_logging(log_dir: Optional[str] = None, 
                  log_level: Union[int, str] = logging.INFO, 
@@ -14,6 +15,9 @@ def setup_logging(log_dir: Optional[str] = None,
     """
     Set up logging for the application.
     
+    File logging goes through a queue drained by a background thread, so log
+    calls on the processing path never block on disk I/O or rotation.
+    
     Args:
         log_dir: Directory to save log files. If None, logs will only go to console.
         log_level: Logging level for file logs.
@@ -22,9 +26,14 @@ def setup_logging(log_dir: Optional[str] = None,
     Returns:
         The configured root logger.
     """
+    global _queue_listener
+    
     # Get the root logger
     logger = logging.getLogger()
     
+    # Stop writing to any previously configured log file
+    shutdown_logging()
+    
     # Clear any existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
@@ -45,6 +54,11 @@ def setup_logging(log_dir: Optional[str] = None,
     
     # Add file handler if log_dir is specified
     if log_dir:
+        import atexit
+        import datetime
+        import queue
+        from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+        
         # Create log directory if it doesn't exist
         os.makedirs(log_dir, exist_ok=True)
         
@@ -52,18 +66,46 @@ def setup_logging(log_dir: Optional[str] = None,
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = os.path.join(log_dir, f"fotofiler_{timestamp}.log")
         
-        # Add a file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Create a file handler, written to by the queue listener's thread
+        file_handler = RotatingFileHandler(
             log_file, maxBytes=10*1024*1024, backupCount=5
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # Loggers only enqueue records; the listener does the file I/O
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
+        
+        # Flush queued records before the interpreter exits (registered only once)
+        atexit.unregister(shutdown_logging)
+        atexit.register(shutdown_logging)
+        
+        _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
         
         logger.info("Logging to file: %s", log_file)
     
     return logger
 
+def shutdown_logging() -> None:
+    """
+    Stop the background log file writer, flushing any queued records.
+    
+    Safe to call more than once, or when file logging was never set up.
+    """
+    global _queue_listener
+    
+    listener, _queue_listener = _queue_listener, None
+    if listener is None:
+        return
+    
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
 def get_tqdm_compatible_logger(name: str = "fotofiler") -> logging.Logger:
     """
     Get a logger that's compatible with tqdm progress bars.
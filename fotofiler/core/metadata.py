@@ -3,30 +3,139 @@ Metadata extraction module for FotoFiler.
 Uses exiftool to extract metadata from image files.
 """
 import os
-import json
-import subprocess
+import sys
+import threading
+from collections import deque
 from datetime import datetime
 import logging
-from typing import Dict, List, Optional, Any, Union
+from typing import AbstractSet, Dict, Iterator, List, Optional, Any, Tuple, Union
+
+# Parse exiftool's JSON output with orjson when it's installed; both accept raw bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# File extensions processed when none are configured
+DEFAULT_FILE_TYPES = frozenset(['jpg', 'jpeg', 'png', 'nef', 'cr2', 'arw', 'tiff', 'tif', 'heic'])
+
+# Fields to take the capture date from, in order of preference
+_DATE_FIELDS = (
+    'ExifIFD:DateTimeOriginal', 
+    'ExifIFD:CreateDate', 
+    'ExifIFD:ModifyDate',
+    'File:FileModifyDate',
+    'System:FileModifyDate',
+    'IFD0:ModifyDate'
+)
+
+# Processed fields, grouped by the part of _process_metadata that produces them
+_DATE_KEYS = frozenset(['date', 'time', 'year', 'month', 'day', 'hour', 'minute', 'second', 'datetime'])
+_CAMERA_KEYS = frozenset(['camera_make', 'camera_model', 'camera'])
+_GPS_KEYS = frozenset(['latitude', 'longitude', 'gps'])
+_EXPOSURE_KEYS = frozenset(['iso', 'aperture', 'focal_length', 'shutter_speed'])
+_ALL_FIELDS = _DATE_KEYS | _CAMERA_KEYS | _GPS_KEYS | _EXPOSURE_KEYS | {'lens'}
+
+# Fields to take the lens name from, in order of preference
+_LENS_FIELDS = ('ExifIFD:LensModel', 'ExifIFD:LensInfo', 'Composite:LensID', 'MakerNotes:Lens')
+
+def _parse_exif_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse an exiftool date/time value.
+    
+    Exiftool always writes dates as "YYYY:MM:DD HH:MM:SS", optionally followed
+    by subseconds or a timezone offset, so the fields are sliced out directly
+    instead of going through strptime. Anything after the seconds is ignored.
+    
+    Args:
+        value: The raw metadata value.
+        
+    Returns:
+        The parsed datetime, or None if the value isn't a valid date/time.
+    """
+    try:
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]))
+    except (ValueError, TypeError, IndexError):
+        return None
+
+def _path_key(path: str) -> str:
+    """
+    Normalize a path for matching exiftool's SourceFile against the input path.
+    
+    Exiftool reports paths with forward slashes, even on Windows, so separators
+    are unified after the case and redundant parts are normalized.
+    
+    Args:
+        path: The file path.
+        
+    Returns:
+        The key to look the path up by.
+    """
+    key = os.path.normcase(os.path.normpath(path))
+    return key.replace(os.sep, '/') if os.sep != '/' else key
+
 class MetadataExtractor:
     """Class to extract metadata from image files using exiftool."""
     
-    def __init__(self, file_types: Optional[List[str]] = None):
+    # Arguments passed to every exiftool invocation (JSON output, group names)
+    EXIFTOOL_ARGS = ['-j', '-a', '-u', '-G1']
+    
+    # Maximum number of files handled by a single exiftool process
+    BATCH_SIZE = 500
+    
+    def __init__(self, file_types: Optional[List[str]] = None, max_workers: Optional[int] = None):
         """
         Initialize the metadata extractor.
         
         Args:
             file_types: List of file extensions to process (e.g., ['jpg', 'png']).
                         If None, all supported extensions will be processed.
+            max_workers: Maximum number of exiftool processes to run concurrently
+                         when scanning a directory. If None, the CPU count is used.
         """
-        self.file_types = file_types or ['jpg', 'jpeg', 'png', 'nef', 'cr2', 'arw', 'tiff', 'tif', 'heic']
+        self.file_types = frozenset(ext.lower() for ext in (file_types or DEFAULT_FILE_TYPES))
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        # Shared instances of repeated metadata values, see _pool_string
+        self._str_pool: Dict[str, str] = {}
+        
+        # Long-lived exiftool process used by extract_metadata, started on first use
+        self._session = None
+        self._session_lock = threading.Lock()
+        
         self._check_exiftool()
     
+    def __del__(self):
+        """Shut down the exiftool session when the extractor is garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    def close(self) -> None:
+        """Shut down the long-lived exiftool process, if one was started."""
+        session, self._session = getattr(self, '_session', None), None
+        if session is None:
+            return
+        
+        import subprocess
+        
+        try:
+            session.stdin.write(b'-stay_open\nFalse\n')
+            session.stdin.close()
+            session.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            session.kill()
+        finally:
+            session.stdout.close()
+    
     def _check_exiftool(self) -> None:
         """Check if exiftool is installed and available in the PATH."""
+        import subprocess
+        
         try:
             subprocess.run(['exiftool', '-ver'], 
                           check=True, 
@@ -48,15 +157,22 @@ class MetadataExtractor:
         Returns:
             True if the file is supported, False otherwise.
         """
-        ext = os.path.splitext(filename)[1].lower().lstrip('.')
-        return ext in self.file_types
+        base, dot, ext = filename.rpartition('.')
+        
+        # Like os.path.splitext, names without a dot or with only leading dots have no extension
+        if not dot or not base.strip('.'):
+            return False
+        
+        return ext.lower() in self.file_types
     
-    def extract_metadata(self, file_path: str) -> Dict[str, Any]:
+    def extract_metadata(self, file_path: str, fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
         """
         Extract metadata from a single file using exiftool.
         
         Args:
             file_path: Path to the image file.
+            fields: Names of the metadata fields needed, see _process_metadata.
+                    If None, all fields are extracted.
             
         Returns:
             Dictionary containing the extracted metadata.
@@ -69,36 +185,138 @@ class MetadataExtractor:
             logger.error("File not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        try:
+            records = self._run_exiftool_session(file_path)
+        except RuntimeError as e:
+            logger.error("Exiftool failed to extract metadata from %s: %s", file_path, e)
+            raise RuntimeError(f"Failed to extract metadata from {file_path}: {e}")
+        
+        if not records:
+            logger.error("Exiftool returned no metadata for %s", file_path)
+            raise RuntimeError(f"Failed to extract metadata from {file_path}: no output from exiftool")
+        
+        # Process and standardize the metadata
+        return self._process_metadata(records[0], file_path, fields)
+    
+    def _run_exiftool_session(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Extract metadata from a file using the long-lived exiftool process.
+        
+        Exiftool is started once in -stay_open mode and fed one request per
+        file, so repeated calls don't pay the interpreter startup cost.
+        
+        Args:
+            file_path: Path to the image file.
+            
+        Returns:
+            List of raw metadata dictionaries (empty if exiftool couldn't read the file).
+            
+        Raises:
+            RuntimeError: If exiftool fails or its output can't be parsed.
+        """
+        import subprocess
+        
+        with self._session_lock:
+            if self._session is None or self._session.poll() is not None:
+                try:
+                    self._session = subprocess.Popen(
+                        ['exiftool', '-stay_open', 'True', '-@', '-'],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL
+                    )
+                except OSError as e:
+                    raise RuntimeError(f"Exiftool failed to start: {e}")
+            
+            session = self._session
+            try:
+                args = [os.fsencode(file_path), *map(os.fsencode, self.EXIFTOOL_ARGS), b'-execute']
+                session.stdin.write(b'\n'.join(args) + b'\n')
+                session.stdin.flush()
+                
+                # Read the response up to exiftool's completion marker
+                lines = []
+                for line in session.stdout:
+                    if line.rstrip() == b'{ready}':
+                        break
+                    lines.append(line)
+                else:
+                    raise RuntimeError("Exiftool exited unexpectedly")
+            except (OSError, RuntimeError) as e:
+                # Don't reuse a process whose output may be out of sync
+                session.kill()
+                self._session = None
+                raise RuntimeError(f"Exiftool failed: {e}")
+        
+        return self._parse_exiftool_output(b''.join(lines))
+    
+    def _run_exiftool(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run a single exiftool process over one or more files.
+        
+        The paths are fed through an argument file on stdin (-@ -), so the
+        number of files isn't limited by the OS command-line length.
+        
+        Args:
+            file_paths: Paths to the image files.
+            
+        Returns:
+            List of raw metadata dictionaries, one for each file exiftool could read.
+            
+        Raises:
+            RuntimeError: If exiftool fails or its output can't be parsed.
+        """
+        import subprocess
+        
         try:
             # Run exiftool with JSON output for easy parsing
             result = subprocess.run(
-                ['exiftool', '-j', '-a', '-u', '-G1', file_path],
-                check=True,
-                capture_output=True,
-                text=True
+                ['exiftool', *self.EXIFTOOL_ARGS, '-@', '-'],
+                input=b'\n'.join(map(os.fsencode, file_paths)),
+                capture_output=True
             )
+        except (subprocess.SubprocessError, OSError) as e:
+            raise RuntimeError(f"Exiftool failed: {e}")
+        
+        # Exiftool exits with an error if any file fails, but still reports the others
+        if result.returncode != 0 and not result.stdout.strip():
+            raise RuntimeError(f"Exiftool failed: {result.stderr.decode(errors='replace').strip()}")
+        
+        return self._parse_exiftool_output(result.stdout)
+    
+    def _parse_exiftool_output(self, output: bytes) -> List[Dict[str, Any]]:
+        """
+        Parse the JSON output of exiftool.
+        
+        Args:
+            output: The raw JSON output written by exiftool (may be empty).
             
-            # Parse the JSON output
-            metadata = json.loads(result.stdout)[0]
-            
-            # Process and standardize the metadata
-            processed_metadata = self._process_metadata(metadata, file_path)
-            return processed_metadata
+        Returns:
+            List of raw metadata dictionaries.
             
-        except subprocess.SubprocessError as e:
-            logger.error("Exiftool failed to extract metadata from %s: %s", file_path, e)
-            raise RuntimeError(f"Failed to extract metadata from {file_path}: {e}")
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse exiftool output for %s: %s", file_path, e)
-            raise RuntimeError(f"Failed to parse exiftool output for {file_path}: {e}")
+        Raises:
+            RuntimeError: If the output can't be parsed.
+        """
+        if not output.strip():
+            return []
+        
+        try:
+            return _json_loads(output)
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse exiftool output: {e}")
     
-    def _process_metadata(self, raw_metadata: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    def _process_metadata(self, raw_metadata: Dict[str, Any], file_path: str,
+                          fields: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
         """
         Process and standardize the raw metadata extracted by exiftool.
         
         Args:
             raw_metadata: The raw metadata dictionary from exiftool.
             file_path: The original file path.
+            fields: Names of the processed fields the caller needs. Groups of
+                    fields (date, camera, lens, GPS, exposure) none of which are
+                    needed are skipped. The basic file fields are always included.
+                    If None, all fields are included.
             
         Returns:
             Processed and standardized metadata dictionary.
@@ -111,100 +329,227 @@ class MetadataExtractor:
         # Initialize processed metadata with basic file info
         processed = {
             'original_filename': base_name,
-            'extension': extension.lower(),
+            'extension': sys.intern(extension.lower()),
             'file_path': file_path,
             'file_size': raw_metadata.get('File:FileSize', ''),
         }
         
+        if fields is None:
+            fields = _ALL_FIELDS
+        
+        if not fields.isdisjoint(_DATE_KEYS):
+            self._process_date(raw_metadata, file_path, processed)
+        
+        if not fields.isdisjoint(_CAMERA_KEYS):
+            # Camera and lens values repeat across a library, so intern them to share one
+            # string object between all records
+            camera_make = sys.intern(raw_metadata.get('IFD0:Make', '').replace(' ', '_'))
+            camera_model = sys.intern(raw_metadata.get('IFD0:Model', '').replace(' ', '_'))
+            
+            processed.update({
+                'camera_make': camera_make,
+                'camera_model': camera_model,
+                'camera': sys.intern(f"{camera_make}_{camera_model}"),
+            })
+        
+        if 'lens' in fields:
+            # Lens information - try multiple possible field names
+            lens = ''
+            for field in _LENS_FIELDS:
+                value = raw_metadata.get(field)
+                if value:
+                    lens = value
+                    break
+            
+            processed['lens'] = sys.intern(lens.replace(' ', '_')) if lens else ''
+        
+        if not fields.isdisjoint(_GPS_KEYS):
+            # GPS information
+            lat = raw_metadata.get('GPS:GPSLatitude') or raw_metadata.get('Composite:GPSLatitude')
+            lon = raw_metadata.get('GPS:GPSLongitude') or raw_metadata.get('Composite:GPSLongitude')
+            if lat and lon:
+                processed.update({
+                    'latitude': lat,
+                    'longitude': lon,
+                    'gps': f"{lat},{lon}"
+                })
+        
+        if not fields.isdisjoint(_EXPOSURE_KEYS):
+            # Other useful EXIF data
+            processed.update({
+                'iso': raw_metadata.get('ExifIFD:ISO', ''),
+                'aperture': raw_metadata.get('ExifIFD:FNumber', '') or raw_metadata.get('Composite:Aperture', ''),
+                'focal_length': self._pool_string((raw_metadata.get('ExifIFD:FocalLength', '') or '').replace(' ', '')),
+                'shutter_speed': raw_metadata.get('ExifIFD:ExposureTime', '') or raw_metadata.get('Composite:ShutterSpeed', ''),
+            })
+        
+        return processed
+    
+    def _process_date(self, raw_metadata: Dict[str, Any], file_path: str, processed: Dict[str, Any]) -> None:
+        """
+        Add the date fields to processed metadata.
+        
+        Args:
+            raw_metadata: The raw metadata dictionary from exiftool.
+            file_path: The original file path.
+            processed: The processed metadata dictionary to update.
+        """
         # Extract date information
         date_taken = None
-        date_fields = [
-            'ExifIFD:DateTimeOriginal', 
-            'ExifIFD:CreateDate', 
-            'ExifIFD:ModifyDate',
-            'File:FileModifyDate',
-            'System:FileModifyDate',
-            'IFD0:ModifyDate'
-        ]
-        
-        for field in date_fields:
-            if field in raw_metadata and raw_metadata[field]:
-                try:
-                    # Exiftool date format is typically: "YYYY:MM:DD HH:MM:SS"
-                    date_str = raw_metadata[field].split('+')[0].strip()  # Remove timezone if present
-                    date_str = date_str.split('-')[0].strip()  # Remove timezone offset if present
-                    date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                    logger.debug("Date found in field %s: %s", field, date_str)
+        
+        for field in _DATE_FIELDS:
+            value = raw_metadata.get(field)
+            if value:
+                date_taken = _parse_exif_datetime(value)
+                if date_taken:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Date found in field %s: %s", field, value)
                     break
-                except (ValueError, TypeError):
-                    continue
         
         # Format date information if available
         if date_taken:
+            year = f"{date_taken.year:04d}"
+            month = f"{date_taken.month:02d}"
+            day = f"{date_taken.day:02d}"
+            hour = f"{date_taken.hour:02d}"
+            minute = f"{date_taken.minute:02d}"
+            second = f"{date_taken.second:02d}"
+            
             processed.update({
-                'date': date_taken.strftime("%Y-%m-%d"),
-                'time': date_taken.strftime("%H-%M-%S"),
-                'year': date_taken.strftime("%Y"),
-                'month': date_taken.strftime("%m"),
-                'day': date_taken.strftime("%d"),
-                'hour': date_taken.strftime("%H"),
-                'minute': date_taken.strftime("%M"),
-                'second': date_taken.strftime("%S"),
-                'datetime': date_taken.strftime("%Y%m%d_%H%M%S"),
+                'date': f"{year}-{month}-{day}",
+                'time': f"{hour}-{minute}-{second}",
+                'year': year,
+                'month': month,
+                'day': day,
+                'hour': hour,
+                'minute': minute,
+                'second': second,
+                'datetime': f"{year}{month}{day}_{hour}{minute}{second}",
             })
         else:
             logger.warning("No date information found for %s", file_path)
+    
+    def _extract_batch(self, file_paths: List[str], fields: Optional[AbstractSet[str]] = None
+                       ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+        """
+        Extract metadata from a batch of files with a single exiftool process.
         
-        # Camera information
-        camera_make = raw_metadata.get('IFD0:Make', '')
-        camera_model = raw_metadata.get('IFD0:Model', '')
-        
-        processed.update({
-            'camera_make': camera_make.replace(' ', '_'),
-            'camera_model': camera_model.replace(' ', '_'),
-            'camera': f"{camera_make}_{camera_model}".replace(' ', '_'),
-        })
-        
-        # Lens information - try multiple possible field names
-        lens_fields = ['ExifIFD:LensModel', 'ExifIFD:LensInfo', 'Composite:LensID', 'MakerNotes:Lens']
-        lens = ''
-        for field in lens_fields:
-            if field in raw_metadata and raw_metadata[field]:
-                lens = raw_metadata[field]
-                break
-                
-        processed['lens'] = lens.replace(' ', '_') if lens else ''
+        Args:
+            file_paths: Paths to the image files.
+            fields: Names of the metadata fields needed, see _process_metadata.
+            
+        Returns:
+            A tuple of (metadata dictionaries, (file_path, error) tuples).
+        """
+        results = []
+        errors = []
         
-        # GPS information
-        lat = raw_metadata.get('GPS:GPSLatitude') or raw_metadata.get('Composite:GPSLatitude')
-        lon = raw_metadata.get('GPS:GPSLongitude') or raw_metadata.get('Composite:GPSLongitude')
-        if lat and lon:
-            processed.update({
-                'latitude': lat,
-                'longitude': lon,
-                'gps': f"{lat},{lon}"
-            })
+        try:
+            records = self._run_exiftool(file_paths)
+        except RuntimeError as e:
+            logger.warning("Failed to extract metadata from %d files: %s", len(file_paths), e)
+            return results, [(file_path, str(e)) for file_path in file_paths]
         
-        # Other useful EXIF data
-        processed.update({
-            'iso': raw_metadata.get('ExifIFD:ISO', ''),
-            'aperture': raw_metadata.get('ExifIFD:FNumber', '') or raw_metadata.get('Composite:Aperture', ''),
-            'focal_length': (raw_metadata.get('ExifIFD:FocalLength', '') or '').replace(' ', ''),
-            'shutter_speed': raw_metadata.get('ExifIFD:ExposureTime', '') or raw_metadata.get('Composite:ShutterSpeed', ''),
-        })
+        raw_by_path = {_path_key(record['SourceFile']): record
+                       for record in records if 'SourceFile' in record}
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for file_path in file_paths:
+            raw_metadata = raw_by_path.get(_path_key(file_path))
+            if raw_metadata is None:
+                logger.warning("Failed to extract metadata from %s: no output from exiftool", file_path)
+                errors.append((file_path, "no output from exiftool"))
+                continue
+            
+            results.append(self._process_metadata(raw_metadata, file_path, fields))
+            if debug:
+                logger.debug("Extracted metadata from: %s", file_path)
         
-        return processed
+        return results, errors
+    
+    def _iter_supported_files(self, directory: str) -> Iterator[str]:
+        """
+        Recursively yield the paths of the supported files in a directory.
+        
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing, so no extra stat call or path join is needed per entry.
+        Directories are walked from an explicit stack rather than nested
+        generators, so each path is yielded directly however deep it is.
+        Files are yielded before descending into subdirectories, like os.walk.
+        
+        Args:
+            directory: The directory to walk.
+            
+        Yields:
+            Paths of the supported files.
+        """
+        is_supported_file = self.is_supported_file
+        pending = [directory]
+        
+        while pending:
+            directory = pending.pop()
+            subdirs = []
+            
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif is_supported_file(entry.name):
+                            yield entry.path
+            except OSError as e:
+                # Skip unreadable directories, as os.walk does
+                logger.warning("Cannot read directory %s: %s", directory, e)
+                continue
+            
+            # Reversed, so subdirectories are popped in listing order
+            pending.extend(reversed(subdirs))
+    
+    def _pool_string(self, value: str) -> str:
+        """
+        Return a shared instance of a frequently repeated metadata string.
+        
+        Unlike sys.intern, the pool belongs to this extractor and is released with it.
+        
+        Args:
+            value: The string value.
+            
+        Returns:
+            The pooled string equal to value.
+        """
+        return self._str_pool.setdefault(value, value)
     
-    def scan_directory(self, directory: str) -> List[Dict[str, Any]]:
+    def scan_directory(self, directory: str, fields: Optional[AbstractSet[str]] = None) -> List[Dict[str, Any]]:
         """
         Scan a directory for image files and extract metadata from each.
         
         Args:
             directory: The directory to scan.
+            fields: Names of the metadata fields needed, see _process_metadata.
+                    If None, all fields are extracted.
             
         Returns:
             List of dictionaries containing metadata for each image file.
             
+        Raises:
+            FileNotFoundError: If the directory doesn't exist.
+        """
+        return list(self.iter_directory(directory, fields))
+    
+    def iter_directory(self, directory: str, fields: Optional[AbstractSet[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Scan a directory for image files, yielding the metadata of each as it's extracted.
+        
+        Unlike scan_directory, only a few batches of metadata are held in memory
+        at a time, so callers can process large libraries as a stream.
+        
+        Args:
+            directory: The directory to scan.
+            fields: Names of the metadata fields needed, see _process_metadata.
+                    If None, all fields are extracted.
+            
+        Returns:
+            Iterator over dictionaries containing metadata for each image file.
+            
         Raises:
             FileNotFoundError: If the directory doesn't exist.
         """
@@ -212,28 +557,58 @@ class MetadataExtractor:
             logger.error("Directory not found: %s", directory)
             raise FileNotFoundError(f"Directory not found: {directory}")
         
+        return self._iter_directory(directory, fields)
+    
+    def _iter_directory(self, directory: str, fields: Optional[AbstractSet[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Generator behind iter_directory.
+        
+        Args:
+            directory: The directory to scan.
+            fields: Names of the metadata fields needed, see _process_metadata.
+            
+        Yields:
+            Dictionaries containing metadata for each image file.
+        """
         logger.info("Scanning directory: %s", directory)
         
-        results = []
-        errors = []
+        success_count = 0
+        error_count = 0
         
-        # Walk through the directory
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if not self.is_supported_file(file):
-                    continue
-                
-                file_path = os.path.join(root, file)
-                try:
-                    metadata = self.extract_metadata(file_path)
-                    results.append(metadata)
-                    logger.debug("Extracted metadata from: %s", file_path)
-                except Exception as e:
-                    logger.warning("Failed to extract metadata from %s: %s", file_path, e)
-                    errors.append((file_path, str(e)))
-        
-        if errors:
-            logger.warning("Failed to extract metadata from %d files", len(errors))
-        
-        logger.info("Successfully extracted metadata from %d files", len(results))
-        return results
+        # Walk through the directory, collecting the supported files
+        file_paths = list(self._iter_supported_files(directory))
+        
+        if file_paths:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # Split the files into batches to amortize exiftool startup, while
+            # keeping enough batches to give every worker something to do
+            batch_size = min(self.BATCH_SIZE, -(-len(file_paths) // self.max_workers))
+            batches = iter([file_paths[start:start + batch_size]
+                            for start in range(0, len(file_paths), batch_size)])
+            workers = min(self.max_workers, -(-len(file_paths) // batch_size))
+            
+            # Each worker drives its own exiftool process. Only one batch more than
+            # there are workers is in flight, so results don't pile up ahead of the
+            # caller, and batches are yielded in file order.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                while True:
+                    while len(pending) <= workers:
+                        batch = next(batches, None)
+                        if batch is None:
+                            break
+                        pending.append(executor.submit(self._extract_batch, batch, fields))
+                    
+                    if not pending:
+                        break
+                    
+                    batch_results, batch_errors = pending.popleft().result()
+                    success_count += len(batch_results)
+                    error_count += len(batch_errors)
+                    yield from batch_results
+        
+        if error_count:
+            logger.warning("Failed to extract metadata from %d files", error_count)
+        
+        logger.info("Successfully extracted metadata from %d files", success_count)
@@ -4,11 +4,30 @@ Handles file renaming based on metadata and user-defined patterns.
 """
 import os
 import re
+import sys
+import string
 import logging
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Placeholders like {date}, {camera}, etc.
+_PLACEHOLDER_RE = re.compile(r'{([^{}]+)}')
+
+# Runs of underscores and characters that are invalid in filenames on common
+# file systems; each run collapses to a single underscore
+_INVALID_CHARS_RUN_RE = re.compile(r'[<>:"/\\|?*_]+')
+
+# File systems on macOS and Windows are case-insensitive by default
+_CASE_INSENSITIVE_FS = sys.platform in ('darwin', 'win32')
+
+class _SafeMetadata(dict):
+    """Metadata mapping for str.format_map that renders missing fields as empty strings."""
+    
+    def __missing__(self, key: str) -> str:
+        logger.warning("Placeholder '%s' not found in metadata", key)
+        return ""
+
 class NamingEngine:
     """Class to generate new filenames using metadata and patterns."""
     
@@ -28,7 +47,11 @@ class NamingEngine:
         self._validate_pattern(self.pattern)
         
         # Compiled regex to find placeholders like {date}, {camera}, etc.
-        self.placeholder_regex = re.compile(r'{([^{}]+)}')
+        self.placeholder_regex = _PLACEHOLDER_RE
+        
+        # The pattern is fixed for the engine's lifetime, so it is compiled once
+        # into a function that builds the name straight from the metadata
+        self._render = self._compile_pattern(self.pattern)
     
     def _validate_pattern(self, pattern: str) -> None:
         """
@@ -43,16 +66,60 @@ class NamingEngine:
         if not pattern:
             raise ValueError("Naming pattern cannot be empty")
         
-        # Check for unbalanced braces
-        if pattern.count('{') != pattern.count('}'):
+        # Single scan: placeholders must be {name}, with no nesting or stray braces
+        placeholder_start = None
+        for i, char in enumerate(pattern):
+            if char == '{':
+                if placeholder_start is not None:
+                    raise ValueError("Naming pattern has invalid placeholder format")
+                placeholder_start = i + 1
+            elif char == '}':
+                if placeholder_start is None:
+                    raise ValueError("Naming pattern has unbalanced braces")
+                
+                name = pattern[placeholder_start:i]
+                if not name:
+                    raise ValueError("Naming pattern has invalid placeholder format")
+                
+                # Numeric placeholders like {0} would be treated as positional fields
+                if name.isdigit():
+                    raise ValueError(f"Naming pattern placeholder must be a name: {{{name}}}")
+                
+                placeholder_start = None
+            elif placeholder_start is not None and not (char.isalnum() or char == '_'):
+                raise ValueError("Naming pattern has invalid placeholder format")
+        
+        if placeholder_start is not None:
             raise ValueError("Naming pattern has unbalanced braces")
         
-        # All placeholders should be in the format {name}
-        if not re.match(r'^[^{}]*({\w+}[^{}]*)*$', pattern):
-            raise ValueError("Naming pattern has invalid placeholder format")
-        
         logger.debug("Naming pattern validated: %s", pattern)
     
+    @staticmethod
+    def _compile_pattern(pattern: str) -> Callable[[Dict[str, Any]], str]:
+        """
+        Compile a validated pattern into a function that fills in its placeholders.
+        
+        The generated function is a single f-string over the metadata, e.g.
+        "{date}_{camera}" becomes f"{m['date']}_{m['camera']}". It raises
+        KeyError if a placeholder is missing from the metadata.
+        
+        Args:
+            pattern: The naming pattern to compile.
+            
+        Returns:
+            Function taking a metadata dictionary and returning the substituted pattern.
+        """
+        parts = []
+        for literal, field, _, _ in string.Formatter().parse(pattern):
+            if literal:
+                parts.append(repr(literal))
+            if field is not None:
+                parts.append(f'f"{{m[{field!r}]}}"')
+        
+        namespace: Dict[str, Any] = {}
+        exec(f"def render(m):\n    return {' '.join(parts) or repr('')}\n", namespace)
+        return namespace['render']
+    
     def generate_filename(self, metadata: Dict[str, Any]) -> str:
         """
         Generate a new filename based on the pattern and metadata.
@@ -62,27 +129,12 @@ class NamingEngine:
             
         Returns:
             The new filename (without path).
-            
-        Raises:
-            ValueError: If a required placeholder is missing in the metadata.
-        """
-        # Find all placeholders in the pattern
-        placeholders = self.placeholder_regex.findall(self.pattern)
-        
-        # Create a copy of the pattern for substitution
-        new_filename = self.pattern
-        
-        # Replace each placeholder with its value from metadata
-        for placeholder in placeholders:
-            if placeholder not in metadata or not str(metadata[placeholder]):
-                logger.warning("Placeholder '%s' not found in metadata or empty", placeholder)
-                # Replace with empty string if metadata is missing
-                value = ""
-            else:
-                value = str(metadata[placeholder])
-            
-            # Replace the placeholder in the pattern
-            new_filename = new_filename.replace(f"{{{placeholder}}}", value)
+        """
+        # Substitute all placeholders in a single pass; missing ones become empty
+        try:
+            new_filename = self._render(metadata)
+        except KeyError:
+            new_filename = self.pattern.format_map(_SafeMetadata(metadata))
         
         # Clean up the filename (remove invalid characters)
         new_filename = self._clean_filename(new_filename)
@@ -103,12 +155,9 @@ class NamingEngine:
         Returns:
             A cleaned filename safe for use in file systems.
         """
-        # Replace invalid characters with underscores
-        invalid_chars = r'[<>:"/\\|?*]'
-        clean_name = re.sub(invalid_chars, '_', filename)
-        
-        # Replace multiple underscores with a single one
-        clean_name = re.sub(r'_+', '_', clean_name)
+        # Replace invalid characters with underscores, collapsing multiple
+        # underscores into a single one in the same pass
+        clean_name = _INVALID_CHARS_RUN_RE.sub('_', filename)
         
         # Remove leading/trailing underscores
         clean_name = clean_name.strip('_')
@@ -119,30 +168,72 @@ class NamingEngine:
         
         return clean_name
     
-    def handle_duplicates(self, filepath: str) -> str:
+    @staticmethod
+    def name_key(name: str) -> str:
+        """
+        Normalize a file name for comparison with the names in existing_names().
+        
+        Args:
+            name: The file name.
+            
+        Returns:
+            The name, case-folded on case-insensitive file systems.
+        """
+        return name.lower() if _CASE_INSENSITIVE_FS else name
+    
+    @staticmethod
+    def existing_names(directory: str) -> Set[str]:
+        """
+        List the names already taken in a directory, for use with handle_duplicates.
+        
+        Args:
+            directory: The directory to list.
+            
+        Returns:
+            Set of normalized file names in the directory (empty if it doesn't exist yet).
+        """
+        try:
+            return {NamingEngine.name_key(name) for name in os.listdir(directory)}
+        except FileNotFoundError:
+            return set()
+    
+    def handle_duplicates(self, filepath: str, existing: Optional[Set[str]] = None) -> str:
         """
         Handle duplicate filenames by appending a number if necessary.
         
         Args:
             filepath: The complete filepath to check for duplicates.
+            existing: Names already taken in the file's directory, as returned by
+                      existing_names(). If given, it is checked instead of the file
+                      system and the chosen name is added to it.
             
         Returns:
             A filepath that doesn't exist yet by appending a number if necessary.
         """
-        if not os.path.exists(filepath):
+        directory, filename = os.path.split(filepath)
+        
+        if existing is None:
+            def is_taken(name: str) -> bool:
+                return os.path.exists(os.path.join(directory, name))
+        else:
+            def is_taken(name: str) -> bool:
+                return self.name_key(name) in existing
+        
+        new_name = filename
+        if is_taken(new_name):
+            name, ext = os.path.splitext(filename)
+            counter = 1
+            while is_taken(new_name):
+                new_name = f"{name}_{counter}{ext}"
+                counter += 1
+        
+        if existing is not None:
+            existing.add(self.name_key(new_name))
+        
+        if new_name == filename:
             return filepath
         
-        directory = os.path.dirname(filepath)
-        filename = os.path.basename(filepath)
-        name, ext = os.path.splitext(filename)
-        
-        counter = 1
-        new_filepath = filepath
-        
-        while os.path.exists(new_filepath):
-            new_name = f"{name}_{counter}{ext}"
-            new_filepath = os.path.join(directory, new_name)
-            counter += 1
-        
-        logger.info("Resolved duplicate: %s -> %s", filepath, new_filepath)
+        new_filepath = os.path.join(directory, new_name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Resolved duplicate: %s -> %s", filepath, new_filepath)
         return new_filepath
@@ -3,12 +3,160 @@ Organization module for FotoFiler.
 Handles folder structure creation and file organization based on metadata.
 """
 import os
+import re
+import sys
+import errno
 import shutil
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import itertools
+import functools
+from collections import deque
+from typing import BinaryIO, Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Placeholders like {year}, {month}, etc.
+_PLACEHOLDER_RE = re.compile(r'{([^{}]+)}')
+
+# A hierarchy segment: (literal, placeholder) fragments followed by a trailing literal
+_Segment = Tuple[Tuple[Tuple[str, str], ...], str]
+
+def _parse_hierarchy(pattern: str) -> Tuple[_Segment, ...]:
+    """
+    Parse a hierarchy pattern into its folder segments.
+    
+    Args:
+        pattern: The hierarchy pattern, e.g. "{year}/{month}/{day}".
+        
+    Returns:
+        One segment per non-empty folder level. "IMG_{year}" becomes
+        ((("IMG_", "year"),), "").
+    """
+    segments = []
+    for segment in pattern.split('/'):
+        if not segment:
+            continue
+        
+        fragments = []
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(segment):
+            fragments.append((segment[position:match.start()], match.group(1)))
+            position = match.end()
+        segments.append((tuple(fragments), segment[position:]))
+    
+    return tuple(segments)
+
+# renameat2() arguments for a rename that fails instead of replacing the target
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+@functools.lru_cache(maxsize=None)
+def _get_renameat2() -> Optional[Callable[..., int]]:
+    """
+    Look up (once) the C library's renameat2 function.
+    
+    Returns:
+        The function, or None if not on Linux or the C library doesn't provide it.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    
+    import ctypes
+    
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+def _rename_noreplace(source_path: str, dest_path: str) -> None:
+    """
+    Rename a file, failing if the destination already exists.
+    
+    On Linux this is a single atomic renameat2(RENAME_NOREPLACE) call, so there is
+    no window between checking for the destination and renaming. On Windows
+    os.rename never replaces an existing file. Elsewhere, and on file systems
+    without RENAME_NOREPLACE support, the destination is checked first.
+    
+    Args:
+        source_path: Path to the source file.
+        dest_path: Path to rename the file to.
+        
+    Raises:
+        FileExistsError: If dest_path already exists.
+        OSError: If the rename fails for another reason (EXDEV across file systems).
+    """
+    renameat2 = _get_renameat2()
+    if renameat2 is not None:
+        if renameat2(_AT_FDCWD, os.fsencode(source_path), _AT_FDCWD, os.fsencode(dest_path),
+                     _RENAME_NOREPLACE) == 0:
+            return
+        
+        import ctypes
+        
+        error = ctypes.get_errno()
+        if error not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(error, os.strerror(error), source_path, None, dest_path)
+    
+    if sys.platform != 'win32' and os.path.lexists(dest_path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest_path)
+    os.rename(source_path, dest_path)
+
+# copy_file_range()/sendfile() errors meaning "not possible here", rather than a failed copy
+_KERNEL_COPY_UNSUPPORTED = frozenset([errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                                      errno.ENOTSUP, errno.EPERM, errno.EBADF])
+
+# Bytes requested per kernel copy call, and buffer size for copies through user space
+_COPY_CHUNK = 1 << 30
+_COPY_BUFSIZE = 1 << 20
+
+# In-kernel copies to try, in order, each copying up to _COPY_CHUNK bytes per call.
+# sendfile() only accepts a regular file as its target on Linux.
+_KERNEL_COPIES: List[Callable[[int, int], int]] = []
+if hasattr(os, 'copy_file_range'):
+    _KERNEL_COPIES.append(lambda src_fd, dst_fd: os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK))
+if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+    _KERNEL_COPIES.append(lambda src_fd, dst_fd: os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK))
+
+def _copy_data(src: BinaryIO, dst: BinaryIO) -> None:
+    """
+    Copy the contents of one open file to another, empty one.
+    
+    os.copy_file_range is tried first: the data never leaves the kernel, and
+    file systems such as Btrfs and XFS can share the data blocks instead of
+    duplicating them. Across file systems, where it is often refused, os.sendfile
+    still copies inside the kernel. Where neither is available, the data goes
+    through a user-space buffer.
+    
+    Args:
+        src: Source file, opened for binary reading at its start.
+        dst: Destination file, opened for binary writing and empty.
+    """
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    size = os.fstat(src_fd).st_size
+    
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            # Some file systems (FUSE, network mounts) copy nothing instead of
+            # refusing the call; a non-empty source then goes to the next method
+            if kernel_copy(src_fd, dst_fd) or not size:
+                while kernel_copy(src_fd, dst_fd):
+                    pass
+                return
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            
+            # Start over, in case the call failed part way
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+    
+    shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
 class OrganizationEngine:
     """Class to organize files into folders based on metadata and hierarchy patterns."""
     
@@ -23,7 +171,17 @@ class OrganizationEngine:
         "year_camera": "{year}/{camera}"
     }
     
-    def __init__(self, destination: str, hierarchy: Optional[str] = None):
+    # The templates, parsed once at import and shared by every engine using them
+    _TEMPLATE_SEGMENTS = {name: _parse_hierarchy(pattern) for name, pattern in HIERARCHY_TEMPLATES.items()}
+    
+    # Smallest batch for which organize_files runs moves/copies concurrently
+    CONCURRENT_MIN_FILES = 8
+    
+    # Directory for the per-destination caches of created directories
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".fotofiler", "cache")
+    
+    def __init__(self, destination: str, hierarchy: Optional[str] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize the organization engine.
         
@@ -33,16 +191,36 @@ class OrganizationEngine:
                        Example: "{year}/{month}/{day}"
                        Can also be one of the predefined templates keys.
                        If None, the "flat" hierarchy (no subdirectories) will be used.
+            max_workers: Maximum number of files organize_files moves/copies
+                         concurrently. If None, ThreadPoolExecutor's default is used.
         """
         self.destination = os.path.abspath(destination)
+        self.max_workers = max_workers
         
-        # Determine the hierarchy pattern to use
-        if hierarchy is None or hierarchy == "flat":
-            self.hierarchy_pattern = ""
-        elif hierarchy in self.HIERARCHY_TEMPLATES:
+        # Determine the hierarchy pattern to use. The pattern is parsed once (for
+        # templates, at import); determine_destination_path only fills it in.
+        if hierarchy is None:
+            hierarchy = "flat"
+        if hierarchy in self.HIERARCHY_TEMPLATES:
             self.hierarchy_pattern = self.HIERARCHY_TEMPLATES[hierarchy]
+            self._segments = self._TEMPLATE_SEGMENTS[hierarchy]
         else:
             self.hierarchy_pattern = hierarchy
+            self._segments = _parse_hierarchy(hierarchy)
+        self._path_fragments, self._path_tail = self._flatten_segments(self._segments)
+        
+        # Names already taken in each destination directory, listed on first use
+        self._dir_contents: Dict[str, Set[str]] = {}
+        
+        # Shared by every file for duplicate handling; building a NamingEngine
+        # validates and compiles its pattern, so it isn't done per file
+        from .naming import NamingEngine
+        self._naming = NamingEngine()
+        
+        # Destination directories known to exist, so each is only created once.
+        # Seeded from earlier runs, see _load_created_dirs.
+        self._created_dirs: Set[str] = self._load_created_dirs()
+        self._saved_dir_count = len(self._created_dirs)
         
         logger.info("Destination directory: %s", self.destination)
         logger.info("Hierarchy pattern: %s", self.hierarchy_pattern)
@@ -54,9 +232,131 @@ class OrganizationEngine:
         Args:
             directory: The directory path to ensure exists.
         """
+        if directory in self._created_dirs:
+            return
+        
         if not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
             logger.debug("Created directory: %s", directory)
+        self._created_dirs.add(directory)
+    
+    def _get_cache_path(self) -> str:
+        """
+        Get the path of the created-directories cache for this destination.
+        
+        Returns:
+            Path of the cache file.
+        """
+        import hashlib
+        
+        digest = hashlib.blake2b(self.destination.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"dirs-{digest}.pkl")
+    
+    def _load_created_dirs(self) -> Set[str]:
+        """
+        Load the directories created under this destination by earlier runs.
+        
+        The cache is dropped if the destination's modification time changed since
+        it was written, e.g. because a folder was deleted by hand. Deeper changes
+        are caught by _transfer_file, which recreates a missing directory.
+        
+        Returns:
+            The cached directories, or an empty set if there is no usable cache.
+        """
+        import pickle
+        
+        try:
+            with open(self._get_cache_path(), 'rb') as f:
+                mtime_ns, directories = pickle.load(f)
+            if mtime_ns != os.stat(self.destination).st_mtime_ns:
+                return set()
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.debug("Ignoring unreadable directory cache for %s: %s", self.destination, e)
+            return set()
+        
+        logger.debug("Loaded %d cached directories for %s", len(directories), self.destination)
+        return set(directories)
+    
+    def _save_created_dirs(self) -> None:
+        """
+        Save the directories known to exist under this destination for later runs.
+        
+        Failures are logged and otherwise ignored, since the cache is only an optimization.
+        """
+        import pickle
+        
+        # Nothing new since the cache was loaded or last written
+        if len(self._created_dirs) == self._saved_dir_count:
+            return
+        
+        cache_path = self._get_cache_path()
+        try:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            entry = (os.stat(self.destination).st_mtime_ns, frozenset(self._created_dirs))
+            
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            self._saved_dir_count = len(entry[1])
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug("Could not write directory cache %s: %s", cache_path, e)
+    
+    def _get_dir_contents(self, directory: str) -> Set[str]:
+        """
+        Get the (cached) set of names already taken in a directory.
+        
+        Args:
+            directory: The directory path.
+            
+        Returns:
+            The set of names, shared with later calls for the same directory.
+        """
+        contents = self._dir_contents.get(directory)
+        if contents is None:
+            contents = self._dir_contents[directory] = self._naming.existing_names(directory)
+        return contents
+    
+    def _flatten_segments(self, segments: Tuple[_Segment, ...]) -> Tuple[Tuple[Tuple[str, str], ...], str]:
+        """
+        Merge parsed hierarchy segments into a single path template under the destination.
+        
+        Args:
+            segments: The segments returned by _parse_hierarchy.
+            
+        Returns:
+            (literal, placeholder) fragments for the whole path, with the destination
+            and path separators folded into the literals, and the trailing literal.
+        """
+        fragments = []
+        literal = os.path.join(self.destination, '')
+        for segment_fragments, tail in segments:
+            for segment_literal, key in segment_fragments:
+                fragments.append((literal + segment_literal, key))
+                literal = ''
+            literal += tail + os.sep
+        
+        return tuple(fragments), literal[:-len(os.sep)]
+    
+    @staticmethod
+    def _is_same_file(source_path: str, dest_path: str) -> bool:
+        """
+        Check whether two paths refer to the same existing file.
+        
+        Args:
+            source_path: Path to the source file.
+            dest_path: Path to the destination file.
+            
+        Returns:
+            True if both paths exist and are the same file, False otherwise.
+        """
+        try:
+            return os.path.samefile(source_path, dest_path)
+        except OSError:
+            return False
     
     def determine_destination_path(self, metadata: Dict[str, Any]) -> str:
         """
@@ -68,62 +368,34 @@ class OrganizationEngine:
         Returns:
             The destination directory path.
         """
-        # Start with the base destination
-        dest_path = self.destination
-        
         # If no hierarchy pattern, return the base destination
-        if not self.hierarchy_pattern:
-            return dest_path
-        
-        # Split the hierarchy pattern into segments
-        hierarchy_segments = self.hierarchy_pattern.split('/')
-        
-        # Process each segment
-        for segment in hierarchy_segments:
-            if not segment:
-                continue
-                
-            # Replace placeholders with metadata values
-            segment_value = segment
-            
-            # Find all placeholders like {year}, {month}, etc.
-            import re
-            placeholders = re.findall(r'{([^{}]+)}', segment)
-            
-            for placeholder in placeholders:
-                if placeholder in metadata and metadata[placeholder]:
-                    # Replace the placeholder with its value
-                    value = str(metadata[placeholder])
-                    segment_value = segment_value.replace(f"{{{placeholder}}}", value)
-                else:
-                    # If metadata is missing, use "unknown"
-                    segment_value = segment_value.replace(f"{{{placeholder}}}", "unknown")
-            
-            # Add the segment to the destination path
-            dest_path = os.path.join(dest_path, segment_value)
+        if not self._segments:
+            return self.destination
         
-        return dest_path
+        # Replace placeholders with metadata values, using "unknown" if missing. The
+        # destination and separators are already part of the literals, so the
+        # whole path is built with a single join.
+        return ''.join([literal + str(metadata.get(key) or "unknown")
+                        for literal, key in self._path_fragments]) + self._path_tail
     
-    def organize_file(self, source_path: str, metadata: Dict[str, Any], new_filename: str, 
-                      dry_run: bool = False, move: bool = True) -> Tuple[str, str]:
+    def _plan_file(self, source_path: str, metadata: Dict[str, Any], new_filename: str,
+                   dry_run: bool, move: bool) -> Tuple[str, str]:
         """
-        Organize a single file based on metadata and hierarchy pattern.
+        Choose the destination path for a file and reserve its name, without touching the file.
         
         Args:
             source_path: Path to the source file.
             metadata: Metadata for the file.
             new_filename: The new filename (without path).
-            dry_run: If True, don't actually move/copy the file, just simulate.
-            move: If True, move the file; if False, copy the file.
+            dry_run: Whether this is a simulated run (only affects logging).
+            move: Whether the file will be moved or copied (only affects logging).
             
         Returns:
-            A tuple of (source_path, destination_path).
-            In dry_run mode, destination_path is the path that would be used.
+            A tuple of (source_path, destination_path). If the file is already at
+            its destination, destination_path is source_path.
             
         Raises:
             FileNotFoundError: If the source file doesn't exist.
-            PermissionError: If there are permission issues.
-            OSError: For other file operation errors.
         """
         if not os.path.isfile(source_path):
             logger.error("Source file not found: %s", source_path)
@@ -136,33 +408,164 @@ class OrganizationEngine:
         dest_path = os.path.join(dest_dir, new_filename)
         
         # Handle duplicate filenames
-        from .naming import NamingEngine
-        dest_path = NamingEngine().handle_duplicates(dest_path)
+        existing = self._get_dir_contents(dest_dir)
+        
+        # A file that is already where it belongs (e.g. on a re-run) is left in place
+        if self._naming.name_key(new_filename) in existing and self._is_same_file(source_path, dest_path):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Already organized: %s", source_path)
+            return source_path, source_path
+        
+        dest_path = self._naming.handle_duplicates(dest_path, existing=existing)
         
         # Log the operation
-        operation = "Moving" if move else "Copying"
-        logger.info("%s: %s -> %s%s", 
-                  operation, source_path, dest_path, 
-                  " (dry run)" if dry_run else "")
+        if logger.isEnabledFor(logging.INFO):
+            operation = "Moving" if move else "Copying"
+            logger.info("%s: %s -> %s%s", 
+                      operation, source_path, dest_path, 
+                      " (dry run)" if dry_run else "")
         
-        # In dry run mode, just return the paths
-        if dry_run:
-            return source_path, dest_path
+        return source_path, dest_path
+    
+    @classmethod
+    def _move_file(cls, source_path: str, dest_path: str) -> None:
+        """
+        Move a file without overwriting an existing destination.
+        
+        Within a file system this is a single no-replace rename, see
+        _rename_noreplace. Across file systems the file is copied with
+        _copy_file, then the source is removed once the copy is known to have
+        the source's size.
+        
+        Args:
+            source_path: Path to the source file.
+            dest_path: Path to move the file to.
+            
+        Raises:
+            FileExistsError: If dest_path already exists.
+        """
+        try:
+            _rename_noreplace(source_path, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            cls._copy_file(source_path, dest_path)
+            if os.stat(dest_path).st_size != os.stat(source_path).st_size:
+                os.remove(dest_path)
+                raise OSError(errno.EIO, "Copied file doesn't match the source size", dest_path)
+            os.remove(source_path)
+    
+    @staticmethod
+    def _copy_file(source_path: str, dest_path: str) -> None:
+        """
+        Copy a file and its metadata without overwriting an existing destination.
+        
+        The data is copied by _copy_data, inside the kernel where possible.
+        
+        Args:
+            source_path: Path to the source file.
+            dest_path: Path to copy the file to.
+            
+        Raises:
+            FileExistsError: If dest_path already exists.
+        """
+        # Exclusive creation: fails instead of replacing a file that appeared since planning
+        with open(source_path, 'rb') as src, open(dest_path, 'xb') as dst:
+            try:
+                _copy_data(src, dst)
+            except BaseException:
+                dst.close()
+                os.remove(dest_path)
+                raise
+        
+        shutil.copystat(source_path, dest_path)
+    
+    def _transfer_file(self, source_path: str, dest_path: str, move: bool) -> str:
+        """
+        Move or copy a file to a destination path chosen by _plan_file.
+        
+        Nothing is done if the destination is the source path itself. If a move
+        finds the destination taken since it was planned (e.g. by another run),
+        the next free name is used instead.
+        
+        Args:
+            source_path: Path to the source file.
+            dest_path: Path to move or copy the file to.
+            move: If True, move the file; if False, copy the file.
+            
+        Returns:
+            The path the file was moved or copied to.
+            
+        Raises:
+            PermissionError: If there are permission issues.
+            OSError: For other file operation errors.
+        """
+        # _plan_file found the file already in place
+        if dest_path == source_path:
+            return dest_path
         
         # Create destination directory if it doesn't exist
+        dest_dir = os.path.dirname(dest_path)
         self._ensure_directory_exists(dest_dir)
         
         # Move or copy the file
+        transfer = self._move_file if move else self._copy_file
+        recreated_dir = False
         try:
-            if move:
-                shutil.move(source_path, dest_path)
-            else:
-                shutil.copy2(source_path, dest_path)
+            while True:
+                try:
+                    transfer(source_path, dest_path)
+                    break
+                except FileExistsError:
+                    dest_path = self._naming.handle_duplicates(
+                        dest_path, existing=self._get_dir_contents(dest_dir))
+                except FileNotFoundError:
+                    # The directory may have been removed since it was cached; retry once
+                    if recreated_dir or not os.path.exists(source_path) or os.path.isdir(dest_dir):
+                        raise
+                    self._created_dirs.discard(dest_dir)
+                    self._ensure_directory_exists(dest_dir)
+                    recreated_dir = True
         except (PermissionError, OSError) as e:
             logger.error("Failed to %s file: %s -> %s: %s", 
                        "move" if move else "copy", source_path, dest_path, e)
             raise
         
+        # A moved file frees up its name in the source directory
+        if move:
+            source_dir, source_name = os.path.split(os.path.abspath(source_path))
+            if source_dir in self._dir_contents:
+                self._dir_contents[source_dir].discard(self._naming.name_key(source_name))
+        
+        return dest_path
+    
+    def organize_file(self, source_path: str, metadata: Dict[str, Any], new_filename: str, 
+                      dry_run: bool = False, move: bool = True) -> Tuple[str, str]:
+        """
+        Organize a single file based on metadata and hierarchy pattern.
+        
+        Args:
+            source_path: Path to the source file.
+            metadata: Metadata for the file.
+            new_filename: The new filename (without path).
+            dry_run: If True, don't actually move/copy the file, just simulate.
+            move: If True, move the file; if False, copy the file.
+            
+        Returns:
+            A tuple of (source_path, destination_path).
+            In dry_run mode, destination_path is the path that would be used.
+            
+        Raises:
+            FileNotFoundError: If the source file doesn't exist.
+            PermissionError: If there are permission issues.
+            OSError: For other file operation errors.
+        """
+        source_path, dest_path = self._plan_file(source_path, metadata, new_filename, dry_run, move)
+        
+        # In dry run mode, just return the paths
+        if not dry_run:
+            dest_path = self._transfer_file(source_path, dest_path, move)
+        
         return source_path, dest_path
     
     def organize_files(self, files_metadata: List[Dict[str, Any]], new_filenames: List[str],
@@ -177,20 +580,109 @@ class OrganizationEngine:
             move: If True, move the files; if False, copy the files.
             
         Returns:
-            List of tuples of (source_path, destination_path).
+            List of tuples of (source_path, destination_path), or (source_path,
+            error message) for files that failed.
         """
         if len(files_metadata) != len(new_filenames):
             raise ValueError("Length of files_metadata and new_filenames must match")
         
-        results = []
+        return [(source_path, outcome) for _, source_path, outcome
+                in self.iter_organize_files(zip(files_metadata, new_filenames), dry_run, move)]
+    
+    def iter_organize_files(self, files: Iterable[Tuple[Dict[str, Any], str]],
+                            dry_run: bool = False, move: bool = True) -> Iterator[Tuple[str, str, str]]:
+        """
+        Organize files as they arrive, yielding each result as soon as its file is done.
+        
+        Each file's destination is chosen (and its name reserved) as soon as it is
+        read from files, so duplicates are resolved exactly as they would be file
+        by file. Once at least CONCURRENT_MIN_FILES files have arrived, the
+        moves/copies run concurrently so their blocking file system calls overlap.
         
-        for metadata, new_filename in zip(files_metadata, new_filenames):
+        Args:
+            files: Iterable of (metadata, new_filename) tuples, e.g. from
+                   Pipeline.iter_directory.
+            dry_run: If True, don't actually move/copy the files, just simulate.
+            move: If True, move the files; if False, copy the files.
+            
+        Yields:
+            ('ok', source_path, destination_path) tuples, or ('err', source_path,
+            error message) for files that failed, in the order of files.
+        """
+        files = iter(files)
+        
+        def plan(metadata: Dict[str, Any], new_filename: str) -> Tuple[str, str, str]:
             source_path = metadata['file_path']
             try:
-                result = self.organize_file(source_path, metadata, new_filename, dry_run, move)
-                results.append(result)
+                _, dest_path = self._plan_file(source_path, metadata, new_filename, dry_run, move)
+            except Exception as e:
+                logger.error("Failed to organize file %s: %s", source_path, e)
+                return 'err', source_path, str(e)
+            
+            if not dry_run:
+                try:
+                    # Memoized, so each destination directory is only created once
+                    self._ensure_directory_exists(os.path.dirname(dest_path))
+                except OSError as e:
+                    # Left to fail with the transfer
+                    logger.debug("Could not create directory for %s: %s", dest_path, e)
+            
+            return 'ok', source_path, dest_path
+        
+        def transfer(result: Tuple[str, str, str]) -> Tuple[str, str, str]:
+            status, source_path, dest_path = result
+            if status != 'ok' or dry_run:
+                return result
+            try:
+                dest_path = self._transfer_file(source_path, dest_path, move)
             except Exception as e:
                 logger.error("Failed to organize file %s: %s", source_path, e)
-                results.append((source_path, str(e)))
+                return 'err', source_path, str(e)
+            return status, source_path, dest_path
+        
+        # Small batches aren't worth a thread pool; look ahead to find out
+        head = [plan(*item) for item in itertools.islice(files, self.CONCURRENT_MIN_FILES)]
+        
+        try:
+            if dry_run or len(head) < self.CONCURRENT_MIN_FILES:
+                for result in head:
+                    yield transfer(result)
+                for item in files:
+                    yield transfer(plan(*item))
+            else:
+                yield from self._iter_concurrent(transfer, itertools.chain(
+                    head, (plan(*item) for item in files)))
+        finally:
+            self._save_created_dirs()
+    
+    def _iter_concurrent(self, transfer: Callable[[Tuple[str, str, str]], Tuple[str, str, str]],
+                         planned: Iterator[Tuple[str, str, str]]) -> Iterator[Tuple[str, str, str]]:
+        """
+        Run transfers on a thread pool, yielding their results in submission order.
+        
+        Args:
+            transfer: Function performing one planned transfer and returning its result.
+            planned: Iterator over planned results to transfer.
+            
+        Yields:
+            The result of each transfer.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # ThreadPoolExecutor's own default when max_workers isn't set
+        workers = self.max_workers or min(32, (os.cpu_count() or 1) + 4)
         
-        return results
+        # Enough work is kept in flight to occupy every worker, without
+        # planning (and reserving names) too far ahead of the results
+        max_pending = 4 * workers
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            
+            for result in planned:
+                pending.append(executor.submit(transfer, result))
+                while pending and (pending[0].done() or len(pending) >= max_pending):
+                    yield pending.popleft().result()
+            
+            while pending:
+                yield pending.popleft().result()
@@ -0,0 +1,92 @@
+"""
+Pipeline module for FotoFiler.
+Runs files through metadata extraction, naming and destination planning in a single pass.
+"""
+import os
+import logging
+from typing import Dict, Any, Iterator, Tuple
+
+from .metadata import MetadataExtractor
+from .naming import NamingEngine
+from .organization import OrganizationEngine
+
+logger = logging.getLogger(__name__)
+
+class Pipeline:
+    """Class to process each file from metadata to new filename and destination in one stage."""
+    
+    # Fields every record needs, regardless of the patterns in use
+    REQUIRED_FIELDS = frozenset(['file_path', 'original_filename', 'extension'])
+    
+    def __init__(self, metadata_extractor: MetadataExtractor, naming_engine: NamingEngine,
+                 organization_engine: OrganizationEngine):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            metadata_extractor: The extractor used to read file metadata.
+            naming_engine: The engine used to generate new filenames.
+            organization_engine: The engine used to determine destination folders.
+        """
+        self.metadata_extractor = metadata_extractor
+        self.naming_engine = naming_engine
+        self.organization_engine = organization_engine
+        
+        # Only the metadata fields referenced by the naming pattern or the folder
+        # hierarchy (which share the same placeholder syntax) are extracted
+        placeholder_regex = naming_engine.placeholder_regex
+        self.fields = frozenset(
+            self.REQUIRED_FIELDS
+            | set(placeholder_regex.findall(naming_engine.pattern))
+            | set(placeholder_regex.findall(organization_engine.hierarchy_pattern))
+        )
+        logger.debug("Pipeline metadata fields: %s", ", ".join(sorted(self.fields)))
+    
+    def plan(self, metadata: Dict[str, Any], new_filename: str) -> Tuple[str, str]:
+        """
+        Determine where a file would be placed, without touching the file system.
+        
+        Args:
+            metadata: The metadata dictionary for the file.
+            new_filename: The new filename (without path).
+            
+        Returns:
+            A tuple of (source_path, destination_path).
+        """
+        dest_dir = self.organization_engine.determine_destination_path(metadata)
+        return metadata['file_path'], os.path.join(dest_dir, new_filename)
+    
+    def process_file(self, file_path: str) -> Tuple[str, str]:
+        """
+        Run a single file through metadata extraction, naming and destination planning.
+        
+        Args:
+            file_path: Path to the image file.
+            
+        Returns:
+            A tuple of (source_path, destination_path).
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            RuntimeError: If exiftool fails to extract metadata.
+        """
+        metadata = self.metadata_extractor.extract_metadata(file_path, fields=self.fields)
+        return self.plan(metadata, self.naming_engine.generate_filename(metadata))
+    
+    def iter_directory(self, directory: str) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Scan a directory, naming each file as soon as its metadata is extracted.
+        
+        Args:
+            directory: The directory to scan.
+            
+        Returns:
+            Iterator over (metadata, new_filename) tuples.
+            
+        Raises:
+            FileNotFoundError: If the directory doesn't exist.
+        """
+        generate_filename = self.naming_engine.generate_filename
+        
+        return ((metadata, generate_filename(metadata))
+                for metadata in self.metadata_extractor.iter_directory(directory, fields=self.fields))
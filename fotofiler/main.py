@@ -4,19 +4,19 @@ Main entry point for FotoFiler.
 import os
 import sys
 import logging
-import argparse
 import traceback
 from typing import Dict, Any, Optional
 
-from .core.logger import setup_logging
+from .core.logger import setup_logging, shutdown_logging
 from .ui.cli import run_cli
 
 def main():
     """Main entry point for the application."""
     try:
-        # Set up logging
+        # Set up logging. The log file records every file operation; the console
+        # only shows problems, since progress bars already report per-file progress
         log_dir = os.path.join(os.path.expanduser("~"), ".fotofiler", "logs")
-        logger = setup_logging(log_dir=log_dir, console_level=logging.INFO)
+        logger = setup_logging(log_dir=log_dir, console_level=logging.WARNING)
         
         # Run the CLI
         run_cli()
@@ -28,6 +28,8 @@ def main():
         print(f"\nUnexpected error: {e}")
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
     main()
@@ -7,16 +7,19 @@ import sys
 import time
 import logging
 from typing import Dict, Any, List, Optional, Tuple
-from tqdm import tqdm
 
 from ..core.metadata import MetadataExtractor
 from ..core.naming import NamingEngine
 from ..core.organization import OrganizationEngine
+from ..core.pipeline import Pipeline
 from ..core.config import Config
 from ..core.logger import get_tqdm_compatible_logger
 
 logger = get_tqdm_compatible_logger(__name__)
 
+# Progress bars redraw at most twice a second; per-file work is often just a rename
+PROGRESS_MININTERVAL = 0.5
+
 class CLI:
     """Command-line interface for FotoFiler."""
     
@@ -31,18 +34,19 @@ class CLI:
     
     def run(self) -> None:
         """Run the FotoFiler application with CLI interface."""
-        # Display welcome message
-        self._display_header()
-        
-        # Display configuration summary
-        self._display_config()
+        if not self.config.get("quiet"):
+            # Display welcome message
+            self._display_header()
+            
+            # Display configuration summary
+            self._display_config()
         
         # If dry run, show what would be done
         if self.config.get("dry_run"):
             print("\nRunning in DRY RUN mode - no files will be modified.")
         
-        # Confirm before proceeding
-        if not self._confirm_action():
+        # Confirm before proceeding, unless told to go ahead (e.g. in scripts)
+        if not self.config.get("assume_yes") and not self._confirm_action():
             print("\nOperation canceled.")
             sys.exit(0)
         
@@ -87,61 +91,55 @@ class CLI:
     
     def _execute(self) -> None:
         """Execute the photo organization process."""
+        from tqdm import tqdm
+        
+        quiet = self.config.get("quiet")
+        
         try:
-            # Step 1: Scan source directory for photos
-            print("\nScanning for photos...")
-            metadata_extractor = MetadataExtractor(file_types=self.config.get("file_types"))
-            all_metadata = metadata_extractor.scan_directory(self.config.get("source"))
-            
-            if not all_metadata:
-                print("No photos found in the source directory.")
-                return
-            
-            print(f"Found {len(all_metadata)} photos.")
-            
-            # Step 2: Generate new filenames
-            print("\nGenerating new filenames...")
-            naming_engine = NamingEngine(pattern=self.config.get("naming_pattern"))
-            new_filenames = []
-            
-            for metadata in tqdm(all_metadata, desc="Generating filenames"):
-                new_filename = naming_engine.generate_filename(metadata)
-                new_filenames.append(new_filename)
-            
-            # Step 3: Organize files
-            print("\nOrganizing files...")
             organization_engine = OrganizationEngine(
                 destination=self.config.get("destination"),
                 hierarchy=self.config.get("folder_hierarchy")
             )
+            pipeline = Pipeline(
+                MetadataExtractor(file_types=self.config.get("file_types")),
+                NamingEngine(pattern=self.config.get("naming_pattern")),
+                organization_engine
+            )
             
-            # Preview changes
+            # Preview changes: the whole scan is collected first, then previewed
             if self.config.get("dry_run"):
+                print("\nScanning for photos...")
+                all_metadata = []
+                new_filenames = []
+                
+                for metadata, new_filename in tqdm(pipeline.iter_directory(self.config.get("source")),
+                                                   desc="Scanning", unit=" photos",
+                                                   mininterval=PROGRESS_MININTERVAL, disable=quiet):
+                    all_metadata.append(metadata)
+                    new_filenames.append(new_filename)
+                
+                if not all_metadata:
+                    print("No photos found in the source directory.")
+                    return
+                
+                print(f"Found {len(all_metadata)} photos.")
                 self._preview_changes(all_metadata, new_filenames, organization_engine)
                 return
             
-            # Execute changes
-            results = []
+            # Scan, name and organize in a single pass: each file is moved/copied as
+            # soon as its metadata is in, with moves/copies running concurrently
+            print("\nScanning and organizing photos...")
             move = self.config.get("move", True)
+            results = list(tqdm(organization_engine.iter_organize_files(
+                                    pipeline.iter_directory(self.config.get("source")), move=move),
+                                desc="Organizing", unit=" photos",
+                                mininterval=PROGRESS_MININTERVAL, disable=quiet))
             
-            for i, (metadata, new_filename) in enumerate(tqdm(zip(all_metadata, new_filenames), 
-                                                         total=len(all_metadata), 
-                                                         desc="Organizing")):
-                try:
-                    source_path = metadata['file_path']
-                    result = organization_engine.organize_file(
-                        source_path,
-                        metadata,
-                        new_filename,
-                        dry_run=False,
-                        move=move
-                    )
-                    results.append(result)
-                except Exception as e:
-                    logger.error("Failed to organize file %s: %s", metadata['file_path'], e)
-                    results.append((metadata['file_path'], str(e)))
+            if not results:
+                print("No photos found in the source directory.")
+                return
             
-            # Step 4: Display summary
+            # Display summary
             self._display_summary(results)
             
         except Exception as e:
@@ -186,24 +184,20 @@ class CLI:
         
         print("\nThis is a DRY RUN - no files were actually modified.")
     
-    def _display_summary(self, results: List[Tuple[str, str]]) -> None:
+    def _display_summary(self, results: List[Tuple[str, str, str]]) -> None:
         """
         Display a summary of the organization process.
         
         Args:
-            results: List of (source_path, destination_path) tuples.
+            results: List of ('ok', source_path, destination_path) or
+                     ('err', source_path, error message) tuples.
         """
         print("\nSummary:")
         print("="*60)
         
-        success_count = 0
-        error_count = 0
-        
-        for source, dest in results:
-            if isinstance(dest, str) and os.path.exists(dest):
-                success_count += 1
-            else:
-                error_count += 1
+        # Outcomes are already known from the organize step; nothing is re-checked on disk
+        error_count = sum(1 for status, _, _ in results if status == 'err')
+        success_count = len(results) - error_count
         
         operation = "Moved" if self.config.get("move", True) else "Copied"
         print(f"Total files processed: {len(results)}")
@@ -4,31 +4,85 @@ Test script to verify EXIF metadata extraction for FotoFiler.
 This helps diagnose issues with the metadata extraction process.
 """
 import os
+import re
 import sys
 import json
 import subprocess
 from datetime import datetime
 import argparse
 
-def run_exiftool(image_path):
-    """Run exiftool on a single image and return the raw JSON output."""
-    try:
-        result = subprocess.run(
-            ['exiftool', '-j', '-a', '-u', '-G1', image_path],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        return json.loads(result.stdout)[0]
-    except subprocess.SubprocessError as e:
-        print(f"Error running exiftool: {e}")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing exiftool output: {e}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print("exiftool not found. Please install exiftool and ensure it's in your PATH.")
-        sys.exit(1)
+# Placeholders like {year}, {date}, etc.
+PLACEHOLDER_RE = re.compile(r'{([^{}]+)}')
+
+# Exiftool dates, e.g. "2024:03:15 10:11:12", as (year, month, day, hour, minute, second)
+DATE_RE = re.compile(r'(\d{4}):(\d{2}):(\d{2})[ T](\d{2}):(\d{2}):(\d{2})')
+
+# Runs of underscores and characters that are invalid in filenames, as in NamingEngine
+INVALID_CHARS_RUN_RE = re.compile(r'[<>:"/\\|?*_]+')
+
+def parse_pattern(pattern):
+    """Split a pattern into (literal, placeholder) fragments and a trailing literal."""
+    fragments = []
+    position = 0
+    for match in PLACEHOLDER_RE.finditer(pattern):
+        fragments.append((pattern[position:match.start()], match.group(1)))
+        position = match.end()
+    return fragments, pattern[position:]
+
+class ExifToolSession:
+    """A long-lived exiftool process, so each image doesn't pay exiftool's startup cost."""
+    
+    def __init__(self):
+        try:
+            self.process = subprocess.Popen(
+                ['exiftool', '-stay_open', 'True', '-@', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            print("exiftool not found. Please install exiftool and ensure it's in your PATH.")
+            sys.exit(1)
+    
+    def run(self, image_path):
+        """Run exiftool on a single image and return the raw JSON output."""
+        try:
+            self.process.stdin.write(
+                b'\n'.join([b'-j', b'-a', b'-u', b'-G1', os.fsencode(image_path), b'-execute']) + b'\n')
+            self.process.stdin.flush()
+            
+            # Read the response up to exiftool's completion marker
+            lines = []
+            for line in self.process.stdout:
+                if line.rstrip() == b'{ready}':
+                    break
+                lines.append(line)
+            else:
+                print("Error running exiftool: exiftool exited unexpectedly")
+                sys.exit(1)
+            
+            return json.loads(b''.join(lines))[0]
+        except OSError as e:
+            print(f"Error running exiftool: {e}")
+            sys.exit(1)
+        except (json.JSONDecodeError, IndexError) as e:
+            print(f"Error parsing exiftool output: {e}")
+            sys.exit(1)
+    
+    def close(self):
+        """Shut down the exiftool process."""
+        try:
+            self.process.stdin.write(b'-stay_open\nFalse\n')
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
 
 def process_metadata(raw_metadata, file_path):
     """Process and extract key metadata fields from the raw exiftool output."""
@@ -46,7 +100,7 @@ def process_metadata(raw_metadata, file_path):
     }
     
     # Extract date information
-    date_taken = None
+    date_parts = None
     date_fields = [
         'ExifIFD:DateTimeOriginal', 
         'ExifIFD:CreateDate', 
@@ -56,30 +110,41 @@ def process_metadata(raw_metadata, file_path):
     ]
     
     for field in date_fields:
-        if field in raw_metadata and raw_metadata[field]:
-            try:
-                # Exiftool date format is typically: "YYYY:MM:DD HH:MM:SS"
-                date_str = raw_metadata[field].split('+')[0].strip()  # Remove timezone if present
-                date_str = date_str.split('-')[0].strip()  # Remove timezone offset if present
-                date_taken = datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
-                print(f"Date found in field: {field} = {date_str}")
-                break
-            except (ValueError, TypeError) as e:
-                print(f"Error parsing date from {field}: {e}")
-                continue
+        value = raw_metadata.get(field)
+        if not value:
+            continue
+        
+        # Exiftool date format is typically: "YYYY:MM:DD HH:MM:SS", possibly
+        # followed by subseconds or a timezone offset
+        match = DATE_RE.match(str(value))
+        if not match:
+            print(f"Error parsing date from {field}: unrecognized date format {value!r}")
+            continue
+        
+        try:
+            # Only to reject impossible dates such as 0000:00:00
+            datetime(*map(int, match.groups()))
+        except ValueError as e:
+            print(f"Error parsing date from {field}: {e}")
+            continue
+        
+        date_parts = match.groups()
+        print(f"Date found in field: {field} = {match.group(0)}")
+        break
     
     # Format date information if available
-    if date_taken:
+    if date_parts:
+        year, month, day, hour, minute, second = date_parts
         processed.update({
-            'date': date_taken.strftime("%Y-%m-%d"),
-            'time': date_taken.strftime("%H-%M-%S"),
-            'year': date_taken.strftime("%Y"),
-            'month': date_taken.strftime("%m"),
-            'day': date_taken.strftime("%d"),
-            'hour': date_taken.strftime("%H"),
-            'minute': date_taken.strftime("%M"),
-            'second': date_taken.strftime("%S"),
-            'datetime': date_taken.strftime("%Y%m%d_%H%M%S"),
+            'date': f"{year}-{month}-{day}",
+            'time': f"{hour}-{minute}-{second}",
+            'year': year,
+            'month': month,
+            'day': day,
+            'hour': hour,
+            'minute': minute,
+            'second': second,
+            'datetime': f"{year}{month}{day}_{hour}{minute}{second}",
         })
     else:
         print("WARNING: No date information found in the image metadata!")
@@ -135,65 +200,48 @@ def simulate_folder_path(metadata, hierarchy_pattern):
     if not hierarchy_pattern:
         return "Root destination folder (flat organization)"
     
-    # Split the hierarchy pattern into segments
-    hierarchy_segments = hierarchy_pattern.split('/')
     path_parts = []
     
     # Process each segment
-    for segment in hierarchy_segments:
+    for segment in hierarchy_pattern.split('/'):
         if not segment:
             continue
-            
-        # Replace placeholders with metadata values
-        segment_value = segment
-        
-        # Find all placeholders like {year}, {month}, etc.
-        import re
-        placeholders = re.findall(r'{([^{}]+)}', segment)
         
-        for placeholder in placeholders:
-            if placeholder in metadata and metadata[placeholder]:
-                # Replace the placeholder with its value
-                value = str(metadata[placeholder])
-                segment_value = segment_value.replace(f"{{{placeholder}}}", value)
-            else:
+        # Replace placeholders with metadata values
+        fragments, tail = parse_pattern(segment)
+        segment_value = []
+        for literal, placeholder in fragments:
+            value = metadata.get(placeholder)
+            if not value:
                 # If metadata is missing, use "unknown"
-                segment_value = segment_value.replace(f"{{{placeholder}}}", "unknown")
+                value = "unknown"
                 print(f"WARNING: Placeholder '{placeholder}' not found in metadata! Using 'unknown' instead.")
+            segment_value.append(literal + str(value))
         
-        path_parts.append(segment_value)
+        path_parts.append(''.join(segment_value) + tail)
     
     return os.path.join("destination_root", *path_parts)
 
 def test_filename_generation(metadata, naming_pattern):
     """Test how a filename would be generated based on the metadata."""
-    import re
-    
-    # Find all placeholders in the pattern
-    placeholder_regex = re.compile(r'{([^{}]+)}')
-    placeholders = placeholder_regex.findall(naming_pattern)
-    
-    # Create a copy of the pattern for substitution
-    new_filename = naming_pattern
+    fragments, tail = parse_pattern(naming_pattern)
+    parts = []
     
     # Replace each placeholder with its value from metadata
-    for placeholder in placeholders:
+    for literal, placeholder in fragments:
         if placeholder not in metadata or not str(metadata[placeholder]):
             print(f"WARNING: Placeholder '{placeholder}' not found in metadata for filename!")
             # Replace with empty string if metadata is missing
             value = ""
         else:
             value = str(metadata[placeholder])
-        
-        # Replace the placeholder in the pattern
-        new_filename = new_filename.replace(f"{{{placeholder}}}", value)
+        parts.append(literal + value)
     
-    # Clean up the filename (remove invalid characters)
-    invalid_chars = r'[<>:"/\\|?*]'
-    clean_name = re.sub(invalid_chars, '_', new_filename)
+    new_filename = ''.join(parts) + tail
     
-    # Replace multiple underscores with a single one
-    clean_name = re.sub(r'_+', '_', clean_name)
+    # Clean up the filename: replace invalid characters with underscores,
+    # collapsing multiple underscores into a single one in the same pass
+    clean_name = INVALID_CHARS_RUN_RE.sub('_', new_filename)
     
     # Remove leading/trailing underscores
     clean_name = clean_name.strip('_')
@@ -204,32 +252,19 @@ def test_filename_generation(metadata, naming_pattern):
     
     return clean_name
 
-def main():
-    parser = argparse.ArgumentParser(description="Test EXIF metadata extraction for FotoFiler")
-    parser.add_argument("image_path", help="Path to the image file to test")
-    parser.add_argument("--hierarchy", default="{year}/{month}/{day}", 
-                     help="Folder hierarchy pattern to test (default: {year}/{month}/{day})")
-    parser.add_argument("--naming", default="{date}_{camera}_{original_filename}",
-                     help="Naming pattern to test (default: {date}_{camera}_{original_filename})")
-    parser.add_argument("--dump", action="store_true", help="Dump all raw metadata fields")
-    
-    args = parser.parse_args()
-    
-    if not os.path.isfile(args.image_path):
-        print(f"Error: The file {args.image_path} does not exist.")
-        sys.exit(1)
-    
+def report(session, image_path, args):
+    """Print the extracted metadata and simulated destination for a single image."""
     print(f"\n{'='*60}")
-    print(f"Testing EXIF metadata extraction for: {args.image_path}")
+    print(f"Testing EXIF metadata extraction for: {image_path}")
     print(f"{'='*60}\n")
     
     # Run exiftool and get raw metadata
-    raw_metadata = run_exiftool(args.image_path)
+    raw_metadata = session.run(image_path)
     
     # Process the metadata
     print("\nExtracting key metadata fields:")
     print("-" * 40)
-    processed_metadata = process_metadata(raw_metadata, args.image_path)
+    processed_metadata = process_metadata(raw_metadata, image_path)
     
     # Show results
     print("\nProcessed Metadata:")
@@ -265,5 +300,29 @@ def main():
         for key, value in sorted(raw_metadata.items()):
             print(f"{key}: {value}")
 
+def main():
+    parser = argparse.ArgumentParser(description="Test EXIF metadata extraction for FotoFiler")
+    parser.add_argument("image_path", help="Path to the image file, or a directory of images, to test")
+    parser.add_argument("--hierarchy", default="{year}/{month}/{day}", 
+                     help="Folder hierarchy pattern to test (default: {year}/{month}/{day})")
+    parser.add_argument("--naming", default="{date}_{camera}_{original_filename}",
+                     help="Naming pattern to test (default: {date}_{camera}_{original_filename})")
+    parser.add_argument("--dump", action="store_true", help="Dump all raw metadata fields")
+    
+    args = parser.parse_args()
+    
+    if os.path.isdir(args.image_path):
+        image_paths = sorted(entry.path for entry in os.scandir(args.image_path) if entry.is_file())
+    elif os.path.isfile(args.image_path):
+        image_paths = [args.image_path]
+    else:
+        print(f"Error: The file {args.image_path} does not exist.")
+        sys.exit(1)
+    
+    # A single exiftool process serves every image
+    with ExifToolSession() as session:
+        for image_path in image_paths:
+            report(session, image_path, args)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()